@@ -8,6 +8,19 @@ The script expects locally available DWD raw files (no HTTP download here):
 - Station metadata in ./dwd_raw/stations.csv (semicolon/CSV/TSV tolerated)
 - Hourly temperature files per station in ./dwd_raw/temperatures/{STATION_ID}.csv
 
+Parsed stations and per-file results are cached in ./dwd_raw/.cache and only
+re-parsed when the source file's mtime or size changes.
+
+Only the standard library is required. Optional accelerators are used when
+installed (e.g. pip install numpy scipy orjson numba):
+- numpy: batched nearest-station search for grid + cities (fallback: per-point
+  bucket search)
+- scipy: cKDTree nearest-station queries (fallback: numba kernel, then tiled
+  numpy distances)
+- numba: compiled batch kernel when scipy is missing (imported only then)
+- orjson: faster JSON output (fallback: stdlib json, identical output)
+All paths pick the exact nearest station; only the speed differs.
+
 Generated files (atomic writes):
 - ./public/data/temperature-germany-grid.json
 - ./public/data/temperature-germany-cities.json
@@ -16,26 +29,58 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
+import functools
 import json
 import logging
 import math
 import os
-from dataclasses import dataclass
+import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: without numpy the grid falls back to per-cell bucket lookups
+    np = None
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json produces the same compact UTF-8 output, only slower
+    orjson = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # optional: without scipy nearest-station queries scan the bucket grid
+    cKDTree = None
 
 RAW_DIR = Path(__file__).resolve().parent / "dwd_raw"
 STATION_FILE = RAW_DIR / "stations.csv"
 TEMPERATURE_DIR = RAW_DIR / "temperatures"
+CACHE_DIR = RAW_DIR / ".cache"  # parsed stations/temperatures reused between cron runs
+CACHE_VERSION = 1  # bump when Station fields or parsing rules change
 OUTPUT_DIRS = [
     Path(__file__).resolve().parent / "public" / "data",
     Path(__file__).resolve().parent / "data",  # compatibility with existing static setup
 ]
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 GRID_LAT_RANGE = (47.0, 55.0)
 GRID_LON_RANGE = (5.5, 15.5)
 GRID_STEP = 0.25
 BUCKET_SIZE_DEG = 0.5
 MAX_BUCKET_RADIUS = 4  # degrees to expand when searching buckets
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEG = math.pi * EARTH_RADIUS_KM / 180
+STATION_BLOCK = 256  # stations per distance tile in the numpy-only batch search
+
+# Accepted header names per column, in order of preference
+STATION_ID_COLUMNS = ("id", "station_id", "STATION_ID", "Stations_id")
+STATION_NAME_COLUMNS = ("name", "NAME", "Ort", "station")
+STATION_LAT_COLUMNS = ("lat", "latitude", "geoBreite", "gkz_lat")
+STATION_LON_COLUMNS = ("lon", "longitude", "geoLaenge", "gkz_lon")
+TIMESTAMP_COLUMNS = ("timestamp", "time", "datetime", "MESS_DATUM")
+TEMPERATURE_COLUMNS = ("temp", "temperature", "TT_TU", "air_temperature")
 
 GERMAN_CITIES = [
     {"name": "Berlin", "lat": 52.5200, "lon": 13.4050},
@@ -59,14 +104,29 @@ GERMAN_CITIES = [
 ]
 
 
+class _SemicolonDialect(csv.excel):
+    """Fallback when the Sniffer gives up; DWD exports are semicolon-separated."""
+
+    delimiter = ";"
+
+
+# DWD exports are homogeneous, so files sharing a first-line shape share a dialect
+_DIALECT_CACHE: Dict[str, csv.Dialect] = {}
+
+
 def _sniff_dialect(path: Path) -> csv.Dialect:
-    sample = path.read_text(encoding="utf-8", errors="ignore")[:2048]
+    with path.open("rb") as f:
+        sample = f.read(2048).decode("utf-8", "ignore")
+    signature = "".join(ch for ch in sample.split("\n", 1)[0] if not ch.isalnum())
+    cached = _DIALECT_CACHE.get(signature)
+    if cached is not None:
+        return cached
     try:
-        return csv.Sniffer().sniff(sample)
+        dialect = csv.Sniffer().sniff(sample)
     except csv.Error:
-        dialect = csv.get_dialect("excel")
-        dialect.delimiter = ";"
-        return dialect
+        dialect = _SemicolonDialect()
+    _DIALECT_CACHE[signature] = dialect
+    return dialect
 
 
 def _parse_float(value: str) -> Optional[float]:
@@ -79,18 +139,33 @@ def _parse_float(value: str) -> Optional[float]:
     return num
 
 
+def _resolve_columns(header: List[str], *alias_groups: Tuple[str, ...]) -> List[Optional[int]]:
+    """Per alias group, the position of its first name present in the header row."""
+    positions: Dict[str, int] = {}
+    for i, name in enumerate(header):
+        positions.setdefault(name, i)
+    return [next((positions[a] for a in aliases if a in positions), None) for aliases in alias_groups]
+
+
+def _cell(row: List[str], idx: Optional[int]) -> Optional[str]:
+    return row[idx] if idx is not None and idx < len(row) else None
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_timestamp(value: str) -> Optional[dt.datetime]:
     if not value:
         return None
     value = value.strip()
-    # Common DWD: yyyymmddHH (UTC)
+    # Common DWD: yyyymmddHH (UTC); sliced by hand as strptime is far slower
     if value.isdigit() and len(value) in (10, 12):
         try:
-            fmt = "%Y%m%d%H" if len(value) == 10 else "%Y%m%d%H%M"
-            return dt.datetime.strptime(value, fmt).replace(tzinfo=dt.timezone.utc)
+            minute = int(value[10:12]) if len(value) == 12 else 0
+            return dt.datetime(
+                int(value[0:4]), int(value[4:6]), int(value[6:8]), int(value[8:10]), minute, tzinfo=dt.timezone.utc
+            )
         except ValueError:
             pass
-    for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
+    for fmt in (ISO_UTC_FORMAT, "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
         try:
             return dt.datetime.strptime(value, fmt).replace(tzinfo=dt.timezone.utc)
         except ValueError:
@@ -110,53 +185,125 @@ class Station:
     lon: float
     temp: Optional[float] = None
     timestamp: Optional[str] = None  # ISO8601 UTC
+    # Trig terms reused by haversine_km_precomp for every query
+    phi: float = field(init=False, repr=False)
+    cos_phi: float = field(init=False, repr=False)
+    lam: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.phi = math.radians(self.lat)
+        self.cos_phi = math.cos(self.phi)
+        self.lam = math.radians(self.lon)
 
 
 class SpatialIndex:
     def __init__(self, stations: Iterable[Station], bucket_size: float = BUCKET_SIZE_DEG):
         self.bucket_size = bucket_size
         self.buckets: Dict[Tuple[int, int], List[Station]] = {}
-        self._all: List[Station] = []
+        stations = list(stations)
         for st in stations:
-            self._all.append(st)
             key = self._bucket(st.lat, st.lon)
             self.buckets.setdefault(key, []).append(st)
+        # Queries in the same bucket share their ring candidates; grid cells are denser than buckets
+        self._ring_cache: Dict[Tuple[Tuple[int, int], int], List[Station]] = {}
+        self.tree = None
+        if np is not None:
+            self._rows = stations  # maps array/tree rows back to stations
+            self.lats = np.array([s.lat for s in stations], dtype=np.float64)
+            self.lons = np.array([s.lon for s in stations], dtype=np.float64)
+            if cKDTree is not None and stations:
+                self.stations_array = np.stack(_unit_xyz(self.lats, self.lons), axis=1)
+                self.tree = cKDTree(self.stations_array)
 
     def _bucket(self, lat: float, lon: float) -> Tuple[int, int]:
         return (int(lat / self.bucket_size), int(lon / self.bucket_size))
 
-    def _neighbor_cells(self, lat: float, lon: float, radius: int) -> List[Tuple[int, int]]:
-        base = self._bucket(lat, lon)
-        cells = []
+    def _ring(self, base: Tuple[int, int], radius: int) -> Iterable[Tuple[int, int]]:
+        """Cells exactly `radius` buckets away from `base` (the outer shell only)."""
+        if radius == 0:
+            yield base
+            return
         for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                cells.append((base[0] + dx, base[1] + dy))
-        return cells
+            yield (base[0] + dx, base[1] - radius)
+            yield (base[0] + dx, base[1] + radius)
+        for dy in range(-radius + 1, radius):
+            yield (base[0] - radius, base[1] + dy)
+            yield (base[0] + radius, base[1] + dy)
+
+    def _ring_candidates(self, base: Tuple[int, int], radius: int) -> List[Station]:
+        key = (base, radius)
+        candidates = self._ring_cache.get(key)
+        if candidates is None:
+            candidates = []
+            for cell in self._ring(base, radius):
+                candidates.extend(self.buckets.get(cell, []))
+            self._ring_cache[key] = candidates
+        return candidates
 
     def nearest(self, lat: float, lon: float) -> Optional[Tuple[Station, float]]:
+        if self.tree is not None:
+            chord, idx = self.tree.query(_unit_xyz(lat, lon), k=1)
+            return self._rows[int(idx)], _chord_to_km(float(chord))
         best: Optional[Tuple[Station, float]] = None
+        phi = math.radians(lat)
+        cos_phi = math.cos(phi)
+        lam = math.radians(lon)
+        base = self._bucket(lat, lon)
         for radius in range(0, MAX_BUCKET_RADIUS + 1):
-            candidates: List[Station] = []
-            for cell in self._neighbor_cells(lat, lon, radius):
-                candidates.extend(self.buckets.get(cell, []))
-            if not candidates and radius < MAX_BUCKET_RADIUS:
-                continue
-            for st in candidates:
-                dist = haversine_km(lat, lon, st.lat, st.lon)
+            for st in self._ring_candidates(base, radius):
+                dist = haversine_km_precomp(phi, cos_phi, lam, st)
                 if best is None or dist < best[1]:
                     best = (st, dist)
-            if best:
+            # Unscanned stations are at least `radius` buckets away in latitude or longitude
+            reach_deg = radius * self.bucket_size
+            reach_km = reach_deg * KM_PER_DEG * math.cos(math.radians(min(89.0, abs(lat) + reach_deg)))
+            if best is not None and best[1] <= reach_km:
                 return best
         # Fallback to brute-force
-        for st in self._all:
-            dist = haversine_km(lat, lon, st.lat, st.lon)
-            if best is None or dist < best[1]:
-                best = (st, dist)
+        for bucket in self.buckets.values():
+            for st in bucket:
+                dist = haversine_km_precomp(phi, cos_phi, lam, st)
+                if best is None or dist < best[1]:
+                    best = (st, dist)
         return best
 
+    def nearest_batch(self, lats: "np.ndarray", lons: "np.ndarray") -> List[Optional[Station]]:
+        """Exact nearest station for many query points in one vectorized pass (requires numpy)."""
+        if not self._rows:
+            return [None] * len(lats)
+        if self.tree is not None:
+            _, idx = self.tree.query(np.stack(_unit_xyz(lats, lons), axis=1), k=1)
+        elif _numba_nearest_batch() is not None:
+            idx = _numba_nearest_batch()(lats, lons, self.lats, self.lons)
+        else:
+            # Tile the station axis so each distance block stays cache-sized
+            idx = np.zeros(len(lats), dtype=np.intp)
+            best = np.full(len(lats), np.inf)
+            rows = np.arange(len(lats))
+            for start in range(0, len(self._rows), STATION_BLOCK):
+                stop = start + STATION_BLOCK
+                dist = haversine_matrix_km(lats, lons, self.lats[start:stop], self.lons[start:stop])
+                block_idx = np.argmin(dist, axis=1)
+                block_best = dist[rows, block_idx]
+                closer = block_best < best
+                best[closer] = block_best[closer]
+                idx[closer] = block_idx[closer] + start
+        return [self._rows[i] for i in idx.tolist()]
+
+
+def _unit_xyz(lat, lon):
+    """Cartesian coordinates on the unit sphere; works on floats and numpy arrays."""
+    trig = np if np is not None and not isinstance(lat, float) else math
+    phi, lam = trig.radians(lat), trig.radians(lon)
+    return trig.cos(phi) * trig.cos(lam), trig.cos(phi) * trig.sin(lam), trig.sin(phi)
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    r = 6371.0
+    r = EARTH_RADIUS_KM
     phi1, phi2 = math.radians(lat1), math.radians(lat2)
     dphi = math.radians(lat2 - lat1)
     dlambda = math.radians(lon2 - lon1)
@@ -164,76 +311,197 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return 2 * r * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+def haversine_km_precomp(lat1_rad: float, cos_phi1: float, lon1_rad: float, st: Station) -> float:
+    """haversine_km with the query trig hoisted by the caller and the station side cached."""
+    a = math.sin((st.phi - lat1_rad) / 2) ** 2 + cos_phi1 * st.cos_phi * math.sin((st.lam - lon1_rad) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def haversine_matrix_km(lat1: "np.ndarray", lon1: "np.ndarray", lat2: "np.ndarray", lon2: "np.ndarray") -> "np.ndarray":
+    """Pairwise distances with shape (len(lat1), len(lat2))."""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    lam1, lam2 = np.radians(lon1), np.radians(lon2)
+    dphi = phi2[None, :] - phi1[:, None]
+    dlam = lam2[None, :] - lam1[:, None]
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1)[:, None] * np.cos(phi2)[None, :] * np.sin(dlam / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_nearest_batch():
+    """Compile the numba batch kernel on first use; None when numba is not installed.
+
+    Imported lazily: the kernel only runs when scipy is missing, so importing
+    numba up front would slow every cron run for nothing.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    # fastmath without "ninf"/"nnan": the kernels must compare real distances safely
+    fastmath = {"contract", "afn", "reassoc", "arcp", "nsz"}
+
+    @numba.njit(cache=True, fastmath=fastmath)
+    def _haversine_km_nb(lat1, lon1, lat2, lon2):
+        phi1, phi2 = math.radians(lat1), math.radians(lat2)
+        dphi = phi2 - phi1
+        dlambda = math.radians(lon2 - lon1)
+        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+    @numba.njit(cache=True, fastmath=fastmath)
+    def _nearest_nb(lat, lon, slats, slons):
+        best_idx, best_dist = 0, _haversine_km_nb(lat, lon, slats[0], slons[0])
+        for j in range(1, slats.shape[0]):
+            dist = _haversine_km_nb(lat, lon, slats[j], slons[j])
+            if dist < best_dist:
+                best_idx, best_dist = j, dist
+        return best_idx, best_dist
+
+    @numba.njit(cache=True, fastmath=fastmath, parallel=True)
+    def _nearest_batch_nb(qlats, qlons, slats, slons):
+        idx = np.empty(qlats.shape[0], dtype=np.int64)
+        for i in numba.prange(qlats.shape[0]):
+            idx[i] = _nearest_nb(qlats[i], qlons[i], slats, slons)[0]
+        return idx
+
+    return _nearest_batch_nb
+
+
+def _file_signature(stat: os.stat_result) -> Tuple[int, int]:
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cache(name: str) -> Optional[Dict[str, object]]:
+    try:
+        with (CACHE_DIR / name).open("rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # stale or corrupt cache is simply rebuilt
+        logging.warning("Ignoring unreadable cache %s: %s", name, exc)
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION:
+        return None
+    return cached
+
+
+def _store_cache(name: str, payload: Dict[str, object]) -> None:
+    path = CACHE_DIR / name
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump({**payload, "version": CACHE_VERSION}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logging.warning("Could not write cache %s: %s", path, exc)
+
+
 def load_stations(path: Path = STATION_FILE) -> List[Station]:
     if not path.exists():
         logging.warning("Station file not found: %s", path)
         return []
+    signature = _file_signature(path.stat())
+    cached = _load_cache("stations.pkl")
+    if cached and cached.get("path") == str(path) and cached.get("signature") == signature:
+        stations = cached["stations"]
+        logging.info("Loaded %d stations from cache", len(stations))
+        return stations
     dialect = _sniff_dialect(path)
     stations: List[Station] = []
     with path.open("r", encoding="utf-8", errors="ignore") as f:
-        reader = csv.DictReader(f, dialect=dialect)
+        reader = csv.reader(f, dialect=dialect)
+        idx_id, idx_name, idx_lat, idx_lon = _resolve_columns(
+            next(reader, []), STATION_ID_COLUMNS, STATION_NAME_COLUMNS, STATION_LAT_COLUMNS, STATION_LON_COLUMNS
+        )
         for row in reader:
-            station_id = row.get("id") or row.get("station_id") or row.get("STATION_ID") or row.get("Stations_id")
-            name = row.get("name") or row.get("NAME") or row.get("Ort") or row.get("station")
-            lat_raw = row.get("lat") or row.get("latitude") or row.get("geoBreite") or row.get("gkz_lat")
-            lon_raw = row.get("lon") or row.get("longitude") or row.get("geoLaenge") or row.get("gkz_lon")
-            lat = _parse_float(lat_raw)
-            lon = _parse_float(lon_raw)
+            if not row:
+                continue
+            station_id = _cell(row, idx_id)
+            name = _cell(row, idx_name)
+            lat = _parse_float(_cell(row, idx_lat))
+            lon = _parse_float(_cell(row, idx_lon))
             if not station_id or lat is None or lon is None:
                 logging.debug("Skipping incomplete station row: %s", row)
                 continue
             stations.append(Station(id=str(station_id).strip(), name=(name or str(station_id)).strip(), lat=lat, lon=lon))
     logging.info("Loaded %d stations", len(stations))
+    _store_cache("stations.pkl", {"path": str(path), "signature": signature, "stations": stations})
     return stations
 
 
-def _temperature_columns(row: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
-    ts = row.get("timestamp") or row.get("time") or row.get("datetime") or row.get("MESS_DATUM")
-    temp = row.get("temp") or row.get("temperature") or row.get("TT_TU") or row.get("air_temperature")
-    return ts, temp
-
-
 def parse_temperature_file(path: Path) -> Optional[Tuple[float, str]]:
-    if not path.exists():
+    try:
+        f = path.open("r", encoding="utf-8", errors="ignore")
+    except FileNotFoundError:
         return None
-    dialect = _sniff_dialect(path)
     latest: Optional[Tuple[float, dt.datetime]] = None
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
-        reader = csv.reader(f, dialect=dialect)
-        rows = list(reader)
-    if not rows:
-        return None
-    has_header = any(ch.isalpha() for ch in "".join(rows[0]))
-    if has_header:
-        dict_reader = csv.DictReader([",".join(rows[0])] + [",".join(r) for r in rows[1:]])
-        iterable = list(dict_reader)
-    else:
-        iterable = [{"timestamp": r[0] if len(r) > 0 else None, "temp": r[1] if len(r) > 1 else None} for r in rows]
-    for row in iterable:
-        ts_raw, temp_raw = _temperature_columns(row)
-        ts = _parse_timestamp(ts_raw or "")
-        temp = _parse_float(temp_raw)
-        if ts is None or temp is None:
-            continue
-        if latest is None or ts > latest[1]:
-            latest = (temp, ts)
+    with f:
+        first_line = f.readline()
+        if not first_line:
+            return None
+        # Sniff only once the file is known to have content
+        dialect = _sniff_dialect(path)
+        if any(ch.isalpha() for ch in first_line):
+            header = next(csv.reader([first_line], dialect=dialect))
+            idx_ts, idx_temp = _resolve_columns(header, TIMESTAMP_COLUMNS, TEMPERATURE_COLUMNS)
+        else:
+            f.seek(0)
+            idx_ts, idx_temp = 0, 1
+        for row in csv.reader(f, dialect=dialect):
+            ts_raw, temp_raw = _cell(row, idx_ts), _cell(row, idx_temp)
+            ts = _parse_timestamp(ts_raw or "")
+            temp = _parse_float(temp_raw)
+            if ts is None or temp is None:
+                continue
+            if latest is None or ts > latest[1]:
+                latest = (temp, ts)
     if latest is None:
         return None
     temp, ts = latest
-    return temp, ts.replace(tzinfo=dt.timezone.utc).isoformat().replace("+00:00", "Z")
+    return temp, ts.strftime(ISO_UTC_FORMAT)
 
 
 def load_latest_temperatures(stations: List[Station], temperature_dir: Path = TEMPERATURE_DIR) -> None:
     if not temperature_dir.exists():
         logging.warning("Temperature directory not found: %s", temperature_dir)
         return
+    # One readdir instead of up to two exists() checks per station; .csv wins over .txt
+    available: Dict[str, os.DirEntry] = {}
+    with os.scandir(temperature_dir) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext == ".csv" or (ext == ".txt" and stem not in available):
+                available[stem] = entry
+    # Files keep their parse result until their mtime or size changes
+    cached = (_load_cache("temperatures.pkl") or {}).get("files", {})
+    fresh: Dict[str, Tuple[Tuple[int, int], Optional[Tuple[float, str]]]] = {}
+    jobs: List[Tuple[Station, Path, Tuple[int, int]]] = []
+    results: List[Tuple[Station, Optional[Tuple[float, str]]]] = []
     for st in stations:
-        candidate_files = [temperature_dir / f"{st.id}.csv", temperature_dir / f"{st.id}.txt"]
-        chosen = next((p for p in candidate_files if p.exists()), None)
+        chosen = available.get(st.id)
         if not chosen:
             logging.debug("No temperature file for station %s", st.id)
             continue
-        parsed = parse_temperature_file(chosen)
+        path = temperature_dir / chosen.name
+        signature = _file_signature(chosen.stat())
+        hit = cached.get(str(path))
+        if hit and hit[0] == signature:
+            fresh[str(path)] = hit
+            results.append((st, hit[1]))
+        else:
+            jobs.append((st, path, signature))
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        futures = {pool.submit(parse_temperature_file, path): (st, path, sig) for st, path, sig in jobs}
+        for future in as_completed(futures):
+            st, path, signature = futures[future]
+            parsed = future.result()
+            fresh[str(path)] = (signature, parsed)
+            results.append((st, parsed))
+    logging.info("Parsed %d temperature files (%d unchanged since last run)", len(jobs), len(results) - len(jobs))
+    _store_cache("temperatures.pkl", {"files": fresh})
+    for st, parsed in results:
         if not parsed:
             logging.debug("Could not parse temperature for station %s", st.id)
             continue
@@ -261,31 +529,66 @@ def frange(start: float, stop: float, step: float) -> Iterable[float]:
         val += step
 
 
-def build_germany_grid(index: SpatialIndex) -> List[Dict[str, object]]:
-    points: List[Dict[str, object]] = []
+def germany_grid_cells() -> Tuple[Sequence[float], Sequence[float]]:
+    """Flattened grid latitudes and longitudes; contiguous float64 arrays when numpy is available."""
+    if np is not None:
+        lat_vec = np.round(np.arange(GRID_LAT_RANGE[0], GRID_LAT_RANGE[1] + 1e-9, GRID_STEP), 6)
+        lon_vec = np.round(np.arange(GRID_LON_RANGE[0], GRID_LON_RANGE[1] + 1e-9, GRID_STEP), 6)
+        lat_grid, lon_grid = np.meshgrid(lat_vec, lon_vec, indexing="ij")
+        return lat_grid.ravel(), lon_grid.ravel()
+    lon_vec = list(frange(GRID_LON_RANGE[0], GRID_LON_RANGE[1], GRID_STEP))
+    lats: List[float] = []
+    lons: List[float] = []
     for lat in frange(GRID_LAT_RANGE[0], GRID_LAT_RANGE[1], GRID_STEP):
-        for lon in frange(GRID_LON_RANGE[0], GRID_LON_RANGE[1], GRID_STEP):
-            nearest = nearest_station(index, lat, lon)
-            if not nearest:
-                continue
-            points.append(
-                {
-                    "lat": lat,
-                    "lon": lon,
-                    "temp": nearest.temp,
-                    "station_id": nearest.id,
-                    "station_name": nearest.name,
-                }
-            )
+        lats.extend([lat] * len(lon_vec))
+        lons.extend(lon_vec)
+    return lats, lons
+
+
+def with_city_queries(
+    grid_lats: Sequence[float], grid_lons: Sequence[float]
+) -> Tuple[Sequence[float], Sequence[float]]:
+    """Grid cells followed by GERMAN_CITIES so both resolve in one nearest-station pass."""
+    city_lats = [city["lat"] for city in GERMAN_CITIES]
+    city_lons = [city["lon"] for city in GERMAN_CITIES]
+    if np is not None:
+        return np.concatenate([grid_lats, city_lats]), np.concatenate([grid_lons, city_lons])
+    return list(grid_lats) + city_lats, list(grid_lons) + city_lons
+
+
+def nearest_stations(index: SpatialIndex, lats: Sequence[float], lons: Sequence[float]) -> List[Optional[Station]]:
+    """Nearest station per query point; arrays go through one batched pass."""
+    if np is not None and len(lats):
+        return index.nearest_batch(np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64))
+    return [nearest_station(index, lat, lon) for lat, lon in zip(lats, lons)]
+
+
+def build_germany_grid(
+    grid_lats: Sequence[float], grid_lons: Sequence[float], nearest: List[Optional[Station]]
+) -> List[Dict[str, object]]:
+    if hasattr(grid_lats, "tolist"):  # numpy arrays from germany_grid_cells
+        grid_lats, grid_lons = grid_lats.tolist(), grid_lons.tolist()
+    points: List[Dict[str, object]] = []
+    for lat, lon, station in zip(grid_lats, grid_lons, nearest):
+        if not station:
+            continue
+        points.append(
+            {
+                "lat": lat,
+                "lon": lon,
+                "temp": station.temp,
+                "station_id": station.id,
+                "station_name": station.name,
+            }
+        )
     logging.info("Built grid with %d points", len(points))
     return points
 
 
-def build_city_list(index: SpatialIndex) -> List[Dict[str, object]]:
+def build_city_list(nearest: List[Optional[Station]]) -> List[Dict[str, object]]:
     cities: List[Dict[str, object]] = []
-    for city in GERMAN_CITIES:
-        nearest = nearest_station(index, city["lat"], city["lon"])
-        if not nearest:
+    for city, station in zip(GERMAN_CITIES, nearest):
+        if not station:
             logging.debug("No station found near %s", city["name"])
             continue
         cities.append(
@@ -293,9 +596,9 @@ def build_city_list(index: SpatialIndex) -> List[Dict[str, object]]:
                 "name": city["name"],
                 "lat": city["lat"],
                 "lon": city["lon"],
-                "temp": nearest.temp,
-                "station_id": nearest.id,
-                "station_name": nearest.name,
+                "temp": station.temp,
+                "station_id": station.id,
+                "station_name": station.name,
             }
         )
     logging.info("Prepared %d city entries", len(cities))
@@ -305,14 +608,18 @@ def build_city_list(index: SpatialIndex) -> List[Dict[str, object]]:
 def atomic_write_json(path: Path, payload: Dict[str, object]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    if orjson is not None:
+        with tmp_path.open("wb") as f:
+            f.write(orjson.dumps(payload))
+    else:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
     os.replace(tmp_path, path)
     logging.info("Wrote %s", path)
 
 
 def write_json_files(grid: List[Dict[str, object]], cities: List[Dict[str, object]]) -> None:
-    now_iso = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc).isoformat().replace("+00:00", "Z")
+    now_iso = dt.datetime.now(dt.timezone.utc).strftime(ISO_UTC_FORMAT)
     grid_payload = {
         "generated": now_iso,
         "source": "DWD / German Weather Service (station data, interpolated via nearest neighbor)",
@@ -340,8 +647,10 @@ def main() -> None:
         logging.error("No valid temperature readings; aborting")
         return
     index = build_spatial_index(stations_with_temp)
-    grid = build_germany_grid(index)
-    cities = build_city_list(index)
+    grid_lats, grid_lons = germany_grid_cells()
+    nearest = nearest_stations(index, *with_city_queries(grid_lats, grid_lons))
+    grid = build_germany_grid(grid_lats, grid_lons, nearest[:len(grid_lats)])
+    cities = build_city_list(nearest[len(grid_lats):])
     if not grid:
         logging.error("Grid generation failed; aborting write")
         return